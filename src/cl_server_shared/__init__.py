@@ -1,14 +1,53 @@
-"""Shared utilities for CL Server services."""
+"""Shared utilities for CL Server services.
 
-# Public API - Service implementations
-from .config import Config
-from .job_storage import JobStorageService
-from .shared_db import JobRepositoryService
+Public names are imported lazily on first access (PEP 562), so importing the
+package does not load sqlalchemy, pydantic or cl_ml_tools until needed.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .database import create_db_engine, enable_wal_mode
+    from .job_storage import JobStorageService
+    from .progress_throttle import ProgressThrottle
+    from .shared_db import JobRepositoryService
+
+# Public API - name -> defining submodule
+_LAZY_IMPORTS: dict[str, str] = {
+    "Config": ".config",
+    "create_db_engine": ".database",
+    "enable_wal_mode": ".database",
+    "JobStorageService": ".job_storage",
+    "JobRepositoryService": ".shared_db",
+    "ProgressThrottle": ".progress_throttle",
+}
 
 __all__ = [
     # Configuration
     "Config",
+    # Database
+    "create_db_engine",
+    "enable_wal_mode",
     # Services
     "JobStorageService",
     "JobRepositoryService",
+    # Utilities
+    "ProgressThrottle",
 ]
+
+
+def __getattr__(name: str) -> Any:  # pyright: ignore[reportExplicitAny, reportAny]
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)  # pyright: ignore[reportAny]
+    globals()[name] = value
+    return value  # pyright: ignore[reportAny]
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -6,135 +6,282 @@ Usage:
     # Access config values
     database_url = Config.AUTH_DATABASE_URL
     storage_dir = Config.MEDIA_STORAGE_DIR
+
+    # After changing os.environ (e.g. in tests), re-read settings
+    from cl_server_shared.config import refresh_env
+    refresh_env()
 """
 
 import os
+import sys
+from collections.abc import Callable
+from typing import ClassVar
 
+# Plain-dict snapshot of os.environ read by all config helpers. Taken on first
+# use through _env() (not at import) so environment changes made during
+# startup are still seen; call refresh_env() to pick up later changes.
+_ENV: dict[str, str] = {}
+_env_loaded: bool = False
 
-class Config:
-    """Centralized configuration for all CL Server services.
+# Accepted spellings for true boolean values (compared lowercase)
+_TRUTHY: frozenset[str] = frozenset(("true", "1", "yes", "on", "y", "t"))
 
-    All configuration values are class variables that can be accessed directly.
-    Values are loaded from environment variables with sensible defaults.
 
-    Example:
-        from cl_server_shared.config import Config
+# ============================================================================
+# Helper functions
+# ============================================================================
 
-        print(Config.CL_SERVER_DIR)
-        print(Config.AUTH_DATABASE_URL)
+
+def _env() -> dict[str, str]:
+    """Get the environment snapshot, taking it on first use."""
+    global _env_loaded
+
+    if not _env_loaded:
+        _ENV.update(os.environ)
+        _env_loaded = True
+    return _ENV
+
+
+def _get_cl_server_dir() -> str:
+    """Get and validate CL_SERVER_DIR environment variable.
+
+    Returns:
+        Validated CL_SERVER_DIR path
+
+    Raises:
+        ValueError: If CL_SERVER_DIR not set or path not writable
     """
+    cl_server_dir = _env().get("CL_SERVER_DIR")
+    if not cl_server_dir:
+        raise ValueError("CL_SERVER_DIR environment variable must be set")
 
-    # ========================================================================
-    # Helper methods (static)
-    # ========================================================================
+    if not os.path.exists(cl_server_dir):
+        os.makedirs(cl_server_dir, exist_ok=True)
+
+    if not os.access(cl_server_dir, os.W_OK):
+        raise ValueError(
+            f"Storage directory does not exist or no write permission: {cl_server_dir}"
+        )
+
+    return cl_server_dir
 
-    @staticmethod
-    def _get_cl_server_dir() -> str:
-        """Get and validate CL_SERVER_DIR environment variable.
 
-        Returns:
-            Validated CL_SERVER_DIR path
+def _get_value(key: str, default: str) -> str:
+    """Get configuration value from environment with optional default."""
+    return _env().get(key, default)
 
-        Raises:
-            ValueError: If CL_SERVER_DIR not set or path not writable
-        """
-        cl_server_dir = os.getenv("CL_SERVER_DIR")
-        if not cl_server_dir:
-            raise ValueError("CL_SERVER_DIR environment variable must be set")
 
-        if not os.path.exists(cl_server_dir):
-            os.makedirs(cl_server_dir, exist_ok=True)
+def _get_value_or(key: str, default_factory: Callable[[], str]) -> str:
+    """Get configuration value, computing the default only if key is unset."""
+    value = _env().get(key)
+    return value if value is not None else default_factory()
 
-        if not os.access(cl_server_dir, os.W_OK):
-            raise ValueError(
-                f"Storage directory does not exist or no write permission: {cl_server_dir}"
-            )
 
-        return cl_server_dir
+def _get_int(key: str, default: int) -> int:
+    """Get integer configuration value."""
+    raw = _env().get(key)
+    if raw is None:
+        return default
+    return int(raw)
 
-    @staticmethod
-    def _get_value(key: str, default: str) -> str:
-        """Get configuration value from environment with optional default."""
-        return os.getenv(key, default)
 
-    @staticmethod
-    def _get_int(key: str, default: int) -> int:
-        """Get integer configuration value."""
-        return int(os.getenv(key, str(default)))
+def _get_bool(key: str, default: bool = False) -> bool:
+    """Get boolean configuration value."""
+    raw = _env().get(key)
+    if raw is None:
+        return default
+    return raw.lower() in _TRUTHY
 
-    @staticmethod
-    def _get_bool(key: str, default: bool = False) -> bool:
-        """Get boolean configuration value."""
-        return os.getenv(key, str(default)).lower() in ("true", "1", "yes")
 
-    @staticmethod
-    def _get_list(key: str, default: str, separator: str = ",") -> list[str]:
-        """Get list configuration value."""
-        return os.getenv(key, default).split(separator)
+def _get_list(key: str, default: str, separator: str = ",") -> tuple[str, ...]:
+    """Get list configuration value as an immutable tuple of interned strings.
+
+    Items are stripped and empty items dropped, so "a, b," yields ("a", "b").
+    """
+    raw = _env().get(key, default)
+    return tuple(sys.intern(item) for item in map(str.strip, raw.split(separator)) if item)
+
+
+class _LazyConfig(type):
+    """Metaclass that resolves Config settings on first access.
+
+    A setting is computed from the environment the first time it is read and
+    then stored on the class, so later reads are plain class attribute lookups
+    and settings a service never reads are never computed.
+    """
+
+    def __getattr__(cls, name: str) -> object:
+        resolve = _SETTINGS.get(name)
+        if resolve is None:
+            raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
+
+        value = resolve()
+        setattr(cls, name, value)
+        return value
+
+
+class Config(metaclass=_LazyConfig):
+    """Centralized configuration for all CL Server services.
+
+    All configuration values are class variables that can be accessed directly.
+    Values are loaded from environment variables with sensible defaults the
+    first time they are read.
+
+    Example:
+        from cl_server_shared.config import Config
+
+        print(Config.CL_SERVER_DIR)
+        print(Config.AUTH_DATABASE_URL)
+    """
+
+    # ========================================================================
+    # Helper methods (static)
+    # ========================================================================
+
+    _get_cl_server_dir: ClassVar[Callable[[], str]] = staticmethod(_get_cl_server_dir)
+    _get_value: ClassVar[Callable[[str, str], str]] = staticmethod(_get_value)
+    _get_value_or: ClassVar[Callable[[str, Callable[[], str]], str]] = staticmethod(_get_value_or)
+    _get_int: ClassVar[Callable[[str, int], int]] = staticmethod(_get_int)
+    _get_bool: ClassVar[Callable[[str, bool], bool]] = staticmethod(_get_bool)
+    _get_list: ClassVar[Callable[[str, str, str], tuple[str, ...]]] = staticmethod(_get_list)
 
     # ========================================================================
     # Common Configuration
     # ========================================================================
 
-    CL_SERVER_DIR: str = _get_cl_server_dir()
+    # Validated (and created) on first access, not at import
+    CL_SERVER_DIR: ClassVar[str]
 
     # ========================================================================
     # Database Configuration - DIFFERENT defaults per service
     # ========================================================================
 
     # Auth service uses separate database
-    AUTH_DATABASE_URL: str = _get_value("DATABASE_URL", f"sqlite:///{CL_SERVER_DIR}/user_auth.db")
+    AUTH_DATABASE_URL: ClassVar[str]
 
     # Store service and worker share the same database
-    STORE_DATABASE_URL: str = _get_value(
-        "DATABASE_URL", f"sqlite:///{CL_SERVER_DIR}/media_store.db"
-    )
+    STORE_DATABASE_URL: ClassVar[str]
+    WORKER_DATABASE_URL: ClassVar[str]
 
-    WORKER_DATABASE_URL: str = _get_value(
-        "DATABASE_URL", f"sqlite:///{CL_SERVER_DIR}/compute.db"
-    )
+    # Connection pool tuning for server databases (ignored for SQLite)
+    DB_POOL_USE_LIFO: ClassVar[bool]
+    DB_POOL_PRE_PING: ClassVar[bool]
+    DB_POOL_RECYCLE: ClassVar[int]
 
     # ========================================================================
     # Auth Service Configuration
     # ========================================================================
 
-    PRIVATE_KEY_PATH: str = _get_value("PRIVATE_KEY_PATH", f"{CL_SERVER_DIR}/private_key.pem")
-    PUBLIC_KEY_PATH: str = _get_value("PUBLIC_KEY_PATH", f"{CL_SERVER_DIR}/public_key.pem")
-    ALGORITHM: str = "ES256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = _get_int("ACCESS_TOKEN_EXPIRE_MINUTES", 30)
-    ADMIN_USERNAME: str = _get_value("ADMIN_USERNAME", "admin")
-    ADMIN_PASSWORD: str = _get_value("ADMIN_PASSWORD", "admin")
+    PRIVATE_KEY_PATH: ClassVar[str]
+    PUBLIC_KEY_PATH: ClassVar[str]
+    ALGORITHM: ClassVar[str] = "ES256"
+    ACCESS_TOKEN_EXPIRE_MINUTES: ClassVar[int]
+    ADMIN_USERNAME: ClassVar[str]
+    ADMIN_PASSWORD: ClassVar[str]
 
     # ========================================================================
     # Store Service Configuration
     # ========================================================================
 
-    MEDIA_STORAGE_DIR: str = _get_value("MEDIA_STORAGE_DIR", f"{CL_SERVER_DIR}/media")
-    COMPUTE_STORAGE_DIR: str = _get_value("COMPUTE_STORAGE_DIR", f"{CL_SERVER_DIR}/compute")
-    AUTH_DISABLED: bool = _get_bool("AUTH_DISABLED", False)
-    READ_AUTH_ENABLED: bool = _get_bool("READ_AUTH_ENABLED", False)
+    MEDIA_STORAGE_DIR: ClassVar[str]
+    COMPUTE_STORAGE_DIR: ClassVar[str]
+    AUTH_DISABLED: ClassVar[bool]
+    READ_AUTH_ENABLED: ClassVar[bool]
 
     # ========================================================================
     # Worker Configuration
     # ========================================================================
 
-    LOG_LEVEL: str = _get_value("LOG_LEVEL", "INFO")
+    LOG_LEVEL: ClassVar[str]
 
     # Worker-specific
-    WORKER_ID: str = _get_value("WORKER_ID", "worker-default")
-    WORKER_SUPPORTED_TASKS: list[str] = _get_list(
-        "WORKER_SUPPORTED_TASKS", "image_resize,image_conversion"
-    )
-    WORKER_POLL_INTERVAL: int = _get_int("WORKER_POLL_INTERVAL", 5)
+    WORKER_ID: ClassVar[str]
+    WORKER_SUPPORTED_TASKS: ClassVar[tuple[str, ...]]
+    # Same tasks as a frozenset for O(1) membership checks
+    WORKER_SUPPORTED_TASKS_SET: ClassVar[frozenset[str]]
+    WORKER_POLL_INTERVAL: ClassVar[int]
 
     # ========================================================================
     # MQTT Configuration (Store and Worker)
     # ========================================================================
 
-    BROADCAST_TYPE: str = _get_value("BROADCAST_TYPE", "mqtt")
-    MQTT_BROKER: str = _get_value("MQTT_BROKER", "localhost")
-    MQTT_PORT: int = _get_int("MQTT_PORT", 1883)
-    MQTT_TOPIC: str = _get_value("MQTT_TOPIC", "inference/events")
-    MQTT_HEARTBEAT_INTERVAL: int = _get_int("MQTT_HEARTBEAT_INTERVAL", 30)
-    CAPABILITY_TOPIC_PREFIX: str = _get_value("CAPABILITY_TOPIC_PREFIX", "inference/workers")
-    CAPABILITY_CACHE_TIMEOUT: int = _get_int("CAPABILITY_CACHE_TIMEOUT", 10)
+    BROADCAST_TYPE: ClassVar[str]
+    MQTT_BROKER: ClassVar[str]
+    MQTT_PORT: ClassVar[int]
+    MQTT_TOPIC: ClassVar[str]
+    MQTT_HEARTBEAT_INTERVAL: ClassVar[int]
+    # Window for coalescing job progress events (0 publishes every event)
+    MQTT_PROGRESS_FLUSH_INTERVAL_MS: ClassVar[int]
+    CAPABILITY_TOPIC_PREFIX: ClassVar[str]
+    CAPABILITY_CACHE_TIMEOUT: ClassVar[int]
+
+
+# Setting name -> resolver, run on first access of Config.<name>
+_SETTINGS: dict[str, Callable[[], object]] = {
+    # Common
+    "CL_SERVER_DIR": _get_cl_server_dir,
+    # Database
+    "AUTH_DATABASE_URL": lambda: _get_value_or(
+        "DATABASE_URL", lambda: f"sqlite:///{Config.CL_SERVER_DIR}/user_auth.db"
+    ),
+    "STORE_DATABASE_URL": lambda: _get_value_or(
+        "DATABASE_URL", lambda: f"sqlite:///{Config.CL_SERVER_DIR}/media_store.db"
+    ),
+    "WORKER_DATABASE_URL": lambda: _get_value_or(
+        "DATABASE_URL", lambda: f"sqlite:///{Config.CL_SERVER_DIR}/compute.db"
+    ),
+    "DB_POOL_USE_LIFO": lambda: _get_bool("DB_POOL_USE_LIFO", True),
+    "DB_POOL_PRE_PING": lambda: _get_bool("DB_POOL_PRE_PING", True),
+    "DB_POOL_RECYCLE": lambda: _get_int("DB_POOL_RECYCLE", 3600),
+    # Auth service
+    "PRIVATE_KEY_PATH": lambda: _get_value_or(
+        "PRIVATE_KEY_PATH", lambda: f"{Config.CL_SERVER_DIR}/private_key.pem"
+    ),
+    "PUBLIC_KEY_PATH": lambda: _get_value_or(
+        "PUBLIC_KEY_PATH", lambda: f"{Config.CL_SERVER_DIR}/public_key.pem"
+    ),
+    "ACCESS_TOKEN_EXPIRE_MINUTES": lambda: _get_int("ACCESS_TOKEN_EXPIRE_MINUTES", 30),
+    "ADMIN_USERNAME": lambda: _get_value("ADMIN_USERNAME", "admin"),
+    "ADMIN_PASSWORD": lambda: _get_value("ADMIN_PASSWORD", "admin"),
+    # Store service
+    "MEDIA_STORAGE_DIR": lambda: _get_value_or(
+        "MEDIA_STORAGE_DIR", lambda: f"{Config.CL_SERVER_DIR}/media"
+    ),
+    "COMPUTE_STORAGE_DIR": lambda: _get_value_or(
+        "COMPUTE_STORAGE_DIR", lambda: f"{Config.CL_SERVER_DIR}/compute"
+    ),
+    "AUTH_DISABLED": lambda: _get_bool("AUTH_DISABLED", False),
+    "READ_AUTH_ENABLED": lambda: _get_bool("READ_AUTH_ENABLED", False),
+    # Worker
+    "LOG_LEVEL": lambda: _get_value("LOG_LEVEL", "INFO"),
+    "WORKER_ID": lambda: _get_value("WORKER_ID", "worker-default"),
+    "WORKER_SUPPORTED_TASKS": lambda: _get_list(
+        "WORKER_SUPPORTED_TASKS", "image_resize,image_conversion"
+    ),
+    "WORKER_SUPPORTED_TASKS_SET": lambda: frozenset(Config.WORKER_SUPPORTED_TASKS),
+    "WORKER_POLL_INTERVAL": lambda: _get_int("WORKER_POLL_INTERVAL", 5),
+    # MQTT
+    "BROADCAST_TYPE": lambda: _get_value("BROADCAST_TYPE", "mqtt"),
+    "MQTT_BROKER": lambda: _get_value("MQTT_BROKER", "localhost"),
+    "MQTT_PORT": lambda: _get_int("MQTT_PORT", 1883),
+    "MQTT_TOPIC": lambda: _get_value("MQTT_TOPIC", "inference/events"),
+    "MQTT_HEARTBEAT_INTERVAL": lambda: _get_int("MQTT_HEARTBEAT_INTERVAL", 30),
+    "MQTT_PROGRESS_FLUSH_INTERVAL_MS": lambda: _get_int("MQTT_PROGRESS_FLUSH_INTERVAL_MS", 100),
+    "CAPABILITY_TOPIC_PREFIX": lambda: _get_value("CAPABILITY_TOPIC_PREFIX", "inference/workers"),
+    "CAPABILITY_CACHE_TIMEOUT": lambda: _get_int("CAPABILITY_CACHE_TIMEOUT", 10),
+}
+
+
+def refresh_env() -> None:
+    """Forget the environment snapshot and all resolved settings.
+
+    The next Config.<setting> read takes a fresh snapshot of os.environ, so
+    tests (or reloading services) see environment changes made since.
+    """
+    global _env_loaded
+
+    _ENV.clear()
+    _env_loaded = False
+    for name in _SETTINGS:
+        if name in vars(Config):
+            delattr(Config, name)
@@ -0,0 +1,77 @@
+"""Database engine helpers shared by the store service and compute worker.
+
+Usage:
+    from cl_server_shared import Config, create_db_engine
+
+    engine = create_db_engine(Config.WORKER_DATABASE_URL)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+"""
+
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+
+from .json_codec import dumps, loads
+
+# Applied to every new SQLite connection:
+# - WAL lets readers proceed while a worker commits progress updates
+# - synchronous=NORMAL skips the fsync per commit (safe with WAL)
+# - temp tables and a 256 MB memory map avoid extra disk I/O
+# - busy_timeout waits for competing writers instead of failing immediately
+_SQLITE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def enable_wal_mode(dbapi_connection: Any, _connection_record: Any) -> None:  # pyright: ignore[reportExplicitAny, reportAny]
+    """Configure a new SQLite connection for concurrent access.
+
+    Intended as a SQLAlchemy "connect" event listener:
+        event.listen(engine, "connect", enable_wal_mode)
+    """
+    cursor = dbapi_connection.cursor()  # pyright: ignore[reportAny]
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)  # pyright: ignore[reportAny]
+    cursor.close()  # pyright: ignore[reportAny]
+
+
+def create_db_engine(database_url: str, **kwargs: Any) -> Engine:  # pyright: ignore[reportExplicitAny, reportAny]
+    """Create a SQLAlchemy engine configured for CL Server services.
+
+    JSON columns are encoded with json_codec (orjson when installed). SQLite
+    engines get the pragmas from enable_wal_mode on every new connection.
+    Other databases get a LIFO connection pool with pre-ping and recycling
+    (Config.DB_POOL_*), so idle surplus connections age out under low load;
+    explicit kwargs take precedence.
+
+    Args:
+        database_url: SQLAlchemy database URL
+        **kwargs: Extra arguments passed to sqlalchemy.create_engine
+
+    Returns:
+        Configured Engine
+    """
+    if make_url(database_url).get_backend_name() != "sqlite":
+        from .config import Config
+
+        _ = kwargs.setdefault("pool_use_lifo", Config.DB_POOL_USE_LIFO)
+        _ = kwargs.setdefault("pool_pre_ping", Config.DB_POOL_PRE_PING)
+        _ = kwargs.setdefault("pool_recycle", Config.DB_POOL_RECYCLE)
+
+    engine = create_engine(
+        database_url,
+        json_serializer=dumps,
+        json_deserializer=loads,
+        **kwargs,  # pyright: ignore[reportAny]
+    )
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", enable_wal_mode)
+    return engine
+
+
+__all__ = ["create_db_engine", "enable_wal_mode"]
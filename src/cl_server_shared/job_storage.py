@@ -1,19 +1,41 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import os
 import shutil
+import threading
 from os import PathLike
 from pathlib import Path
-from typing import Final, override
+from typing import BinaryIO, ClassVar, Final, Protocol, override
 
 import aiofiles
 from cl_ml_tools import AsyncFileLike, FileLike, JobStorage, SavedJobFile
 
 
+class _Hasher(Protocol):
+    """The part of a hashlib hash object used while writing."""
+
+    def update(self, data: bytes | memoryview, /) -> None: ...
+
+    def hexdigest(self) -> str: ...
+
+
 class JobStorageService(JobStorage):
     """Service for managing file storage with organized directory structure."""
 
+    # Both sizes are multiples of the page size (4/16/64 KB) so buffered
+    # writes map onto whole pages
     _CHUNK_SIZE: Final[int] = 1024 * 1024  # 1 MB
+    _WRITE_BATCH_SIZE: Final[int] = 4 * _CHUNK_SIZE  # 4 MB per worker-thread write
+
+    # Jobs whose created directories are remembered (oldest evicted first)
+    _MAX_CACHED_JOBS: Final[int] = 1024
+
+    # Idle write buffers shared by all instances, reused across saves so
+    # concurrent ingestion does not allocate a fresh 4 MB buffer per upload
+    _MAX_POOLED_BUFFERS: Final[int] = 4
+    _buffer_pool: ClassVar[list[bytearray]] = []
 
     def __init__(self, base_dir: str | None = None):
         """
@@ -28,7 +50,18 @@ class JobStorageService(JobStorage):
             base_dir = Config.MEDIA_STORAGE_DIR
 
         self.base_dir: Path = Path(base_dir)
-        self.base_dir.mkdir(parents=True, exist_ok=True)
+
+        # Jobs root as a string: job paths are built by one Path() call rather
+        # than a chain of "/" operators allocating a Path per segment. Created
+        # here (with base_dir) so per-job calls never have to create it.
+        self._jobs_prefix: str = os.path.join(self.base_dir, "jobs")
+        os.makedirs(self._jobs_prefix, exist_ok=True)
+
+        # job_id -> job-relative directories known to exist ("" is the job dir).
+        # Updated from to_thread workers and by concurrent callers, so every
+        # access holds _known_dirs_lock; the mkdir itself runs outside it.
+        self._known_dirs: dict[str, set[str]] = {}
+        self._known_dirs_lock: threading.Lock = threading.Lock()
 
     # -------------------------------------------------------------------------
     # JobStorage Protocol Methods
@@ -40,10 +73,9 @@ class JobStorageService(JobStorage):
         Args:
             job_id: Unique job identifier
         """
-        job_dir = self.base_dir / "jobs" / job_id
-        job_dir.mkdir(parents=True, exist_ok=True)
-        (job_dir / "input").mkdir(exist_ok=True)
-        (job_dir / "output").mkdir(exist_ok=True)
+        os.makedirs(os.path.join(self._jobs_prefix, job_id, "input"), exist_ok=True)
+        os.makedirs(os.path.join(self._jobs_prefix, job_id, "output"), exist_ok=True)
+        self._remember_dirs(job_id, "", "input", "output")
 
     @override
     def remove(self, job_id: str) -> bool:
@@ -55,11 +87,13 @@ class JobStorageService(JobStorage):
         Returns:
             True if removed successfully, False otherwise
         """
-        job_dir = self.base_dir / "jobs" / job_id
-        if job_dir.exists():
-            shutil.rmtree(job_dir)
-            return True
-        return False
+        with self._known_dirs_lock:
+            _ = self._known_dirs.pop(job_id, None)
+        try:
+            shutil.rmtree(os.path.join(self._jobs_prefix, job_id))
+        except FileNotFoundError:
+            return False
+        return True
 
     @override
     async def save(
@@ -76,50 +110,184 @@ class JobStorageService(JobStorage):
             job_id: Unique job identifier
             relative_path: Relative path within job storage
             file: File to save (async file-like, bytes, str path, or PathLike)
-            mkdirs: Create parent directories if needed
+            mkdirs: Create parent directories if needed (skipped when the parent
+                was made by create_directory or an earlier call for this job)
 
         Returns:
             Metadata of the saved file
         """
         # Resolve target path
-        target_path = self.base_dir / "jobs" / job_id / relative_path
+        target_path = self._job_path(job_id, relative_path)
 
-        file_size = 0
-        hasher = hashlib.sha256()
         # Create parent directories if requested
         if mkdirs:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_parent(job_id, relative_path, target_path)
 
         # Handle different file types
         if isinstance(file, bytes):
-            # Direct bytes
-            _ = target_path.write_bytes(file)
+            # Direct bytes; large payloads are written and hashed off the event loop
             file_size = len(file)
-            hasher.update(file)
+            if file_size > self._CHUNK_SIZE:
+                file_hash = await asyncio.to_thread(self._write_bytes_and_hash, target_path, file)
+            else:
+                file_hash = self._write_bytes_and_hash(target_path, file)
         elif isinstance(file, (str, PathLike)):
-            # Copy from existing file
-            source_path = Path(file)
-            _ = shutil.copy2(source_path, target_path)
-            file_size = target_path.stat().st_size
-            with open(target_path, "rb") as f:
-                for chunk in iter(lambda: f.read(self._CHUNK_SIZE), b""):
-                    hasher.update(chunk)
+            # Copy from existing file off the event loop
+            file_size, file_hash = await asyncio.to_thread(
+                self._copy_and_hash, Path(file), target_path
+            )
         else:
-            async with aiofiles.open(target_path, "wb") as f:
-                while True:
-                    chunk = await file.read(self._CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    _ = await f.write(chunk)
-                    file_size += len(chunk)
-                    hasher.update(chunk)
+            file_size, file_hash = await self._write_stream(file, target_path)
 
         return SavedJobFile(
             relative_path=relative_path,
             size=file_size,
-            hash=hasher.hexdigest(),
+            hash=file_hash,
         )
 
+    def _job_path(self, job_id: str, relative_path: str | None = None) -> Path:
+        """Build the absolute path of a job directory or a file within it."""
+        if relative_path is None:
+            return Path(self._jobs_prefix, job_id)
+        return Path(self._jobs_prefix, job_id, relative_path)
+
+    def _ensure_parent(self, job_id: str, relative_path: str, target_path: Path) -> None:
+        """Create the parent directory of target_path unless it is known to exist.
+
+        Directories made by create_directory or an earlier save/allocate_path
+        are remembered per job, so repeated writes into the same directory
+        skip the mkdir syscalls. remove() forgets a job's directories; removing
+        them by other means while the service is running is not supported.
+        """
+        parent = os.path.dirname(relative_path)
+        with self._known_dirs_lock:
+            known = self._known_dirs.get(job_id)
+            if known is not None and parent in known:
+                return
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        self._remember_dirs(job_id, parent)
+
+    def _remember_dirs(self, job_id: str, *relative_dirs: str) -> None:
+        """Record job-relative directories as existing, evicting the oldest job if full."""
+        with self._known_dirs_lock:
+            known = self._known_dirs.get(job_id)
+            if known is None:
+                if len(self._known_dirs) >= self._MAX_CACHED_JOBS:
+                    _ = self._known_dirs.pop(next(iter(self._known_dirs)), None)
+                known = self._known_dirs[job_id] = set()
+            known.update(relative_dirs)
+
+    async def _write_stream(self, file: AsyncFileLike, target_path: Path) -> tuple[int, str]:
+        """Stream an async file to disk, writing and hashing in worker threads.
+
+        Chunks read from the source are copied into one preallocated buffer of
+        _WRITE_BATCH_SIZE bytes; each time it fills it is written and hashed
+        by a single asyncio.to_thread call, instead of one thread-pool handoff
+        per chunk as with aiofiles. The buffer comes from a small class-level
+        pool, so steady-state saves allocate no buffer memory at all.
+
+        Returns:
+            Tuple of (size in bytes, hex digest)
+        """
+        hasher = hashlib.sha256()
+        file_size = 0
+        buf = self._acquire_buffer()
+        view = memoryview(buf)
+        filled = 0
+
+        f = None
+        try:
+            f = await asyncio.to_thread(open, target_path, "wb")
+            while chunk := await file.read(self._CHUNK_SIZE):
+                data = memoryview(chunk)
+                while data:
+                    n = min(len(data), len(buf) - filled)
+                    view[filled : filled + n] = data[:n]
+                    filled += n
+                    data = data[n:]
+                    if filled == len(buf):
+                        await asyncio.to_thread(self._write_and_hash, f, hasher, view)
+                        file_size += filled
+                        filled = 0
+            if filled:
+                await asyncio.to_thread(self._write_and_hash, f, hasher, view[:filled])
+                file_size += filled
+        finally:
+            if f is not None:
+                await asyncio.to_thread(f.close)
+            view.release()
+            self._release_buffer(buf)
+
+        return file_size, hasher.hexdigest()
+
+    @classmethod
+    def _acquire_buffer(cls) -> bytearray:
+        """Take an idle write buffer from the pool, allocating one if empty."""
+        try:
+            return cls._buffer_pool.pop()
+        except IndexError:
+            return bytearray(cls._WRITE_BATCH_SIZE)
+
+    @classmethod
+    def _release_buffer(cls, buf: bytearray) -> None:
+        """Return a write buffer to the pool (dropped if the pool is full)."""
+        if len(cls._buffer_pool) < cls._MAX_POOLED_BUFFERS:
+            cls._buffer_pool.append(buf)
+
+    @staticmethod
+    def _write_bytes_and_hash(target_path: Path, data: bytes) -> str:
+        """Write data to target_path and return its SHA256 hex digest."""
+        _ = target_path.write_bytes(data)
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def _write_and_hash(f: BinaryIO, hasher: _Hasher, data: memoryview) -> None:
+        """Write a batch to f and feed it to hasher (runs in a worker thread)."""
+        _ = f.write(data)
+        hasher.update(data)
+
+    @staticmethod
+    def _copy_and_hash(source_path: Path, target_path: Path) -> tuple[int, str]:
+        """Copy a file and compute the SHA256 of the copy.
+
+        Runs in a worker thread, in two passes over the data. First the copy
+        happens inside the kernel (copy_file_range, falling back to shutil's
+        sendfile-based copy), so data never passes through Python. Then the
+        target is read back, normally from the page cache, and hashed by
+        hashlib.file_digest, which loops in C and releases the GIL. Hashing
+        the copy rather than the source means the digest describes what was
+        stored. File metadata is copied afterwards, matching shutil.copy2.
+
+        Returns:
+            Tuple of (size in bytes, hex digest)
+        """
+        copied = False
+        if hasattr(os, "copy_file_range"):
+            try:
+                with open(source_path, "rb") as src, open(target_path, "wb") as dst:
+                    size = os.fstat(src.fileno()).st_size
+                    remaining = size
+                    while remaining > 0:
+                        n = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if n == 0:
+                            break
+                        remaining -= n
+                # st_size of 0 (procfs, sysfs, some FUSE/network files) or a
+                # short copy means the size cannot be trusted; let shutil
+                # copy up to the real EOF instead
+                copied = size > 0 and remaining == 0
+            except OSError:
+                # Unsupported by the filesystem (e.g. across devices)
+                pass
+        if not copied:
+            _ = shutil.copyfile(source_path, target_path)
+        shutil.copystat(source_path, target_path)
+
+        with open(target_path, "rb") as f:
+            file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+            file_size = os.fstat(f.fileno()).st_size
+        return file_size, file_hash
+
     @override
     def allocate_path(
         self,
@@ -135,15 +303,16 @@ class JobStorageService(JobStorage):
         Args:
             job_id: Unique job identifier
             relative_path: Relative path within job storage
-            mkdirs: Create parent directories if needed
+            mkdirs: Create parent directories if needed (skipped when the parent
+                was made by create_directory or an earlier call for this job)
 
         Returns:
             Absolute Path object
         """
-        target_path = self.base_dir / "jobs" / job_id / relative_path
+        target_path = self._job_path(job_id, relative_path)
 
         if mkdirs:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_parent(job_id, relative_path, target_path)
 
         return target_path
 
@@ -162,7 +331,7 @@ class JobStorageService(JobStorage):
         Returns:
             Async file-like object
         """
-        target_path = self.base_dir / "jobs" / job_id / relative_path
+        target_path = self._job_path(job_id, relative_path)
         return await aiofiles.open(target_path, "rb")
 
     @override
@@ -180,6 +349,4 @@ class JobStorageService(JobStorage):
         Returns:
             Absolute Path object
         """
-        if relative_path is None:
-            return self.base_dir / "jobs" / job_id
-        return self.base_dir / "jobs" / job_id / relative_path
+        return self._job_path(job_id, relative_path)
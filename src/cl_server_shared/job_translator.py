@@ -5,36 +5,75 @@
 # Pydantic Conversion Helpers
 # -------------------------------------------------------------------------
 
-from cl_ml_tools import JobRecord
+from time import time_ns
+from typing import TypeAlias
+
+from cl_ml_tools.common.schema_job_record import JobRecord, JobStatus
 
 from .models import Job
+from .models.job import JSONObject
+
+# Status column value -> JobStatus, avoiding the Enum value lookup per row
+_STATUS_BY_VALUE: dict[str, JobStatus] = {status.value: status for status in JobStatus}
+
+# The columns db_job_to_job_record reads; selecting just these returns rows
+# that convert without hydrating a full ORM Job
+JOB_RECORD_COLUMNS = (
+    Job.job_id,
+    Job.task_type,
+    Job.params,
+    Job.output,
+    Job.status,
+    Job.progress,
+    Job.error_message,
+)
 
+# Value types of a row selected with JOB_RECORD_COLUMNS, in the same order.
+# SQLAlchemy types Row as a tuple subtype, so such rows are accepted as-is.
+JobRecordRow: TypeAlias = tuple[str, str, JSONObject, JSONObject | None, str, int, str | None]
 
-def db_job_to_job_record(db_job: Job) -> "JobRecord":
+
+def db_job_to_job_record(db_job: Job | JobRecordRow) -> JobRecord:
     """Convert SQLAlchemy Job to Pydantic JobRecord.
 
+    Rows were validated when written and params/output are already decoded by
+    the JSON column type, so the record is built without re-validating them.
+
+    Args:
+        db_job: Job instance, or a row selected with JOB_RECORD_COLUMNS
+
     Returns:
         Pydantic JobRecord with core job fields
     """
-    from cl_ml_tools.common.schema_job_record import JobRecord, JobStatus
-
-    return JobRecord(
-        job_id=db_job.job_id,
-        task_type=db_job.task_type,
-        params=db_job.params,
-        output=db_job.output,
-        status=JobStatus(db_job.status),
-        progress=db_job.progress,
-        error_message=db_job.error_message,
+    if isinstance(db_job, Job):
+        db_job = (
+            db_job.job_id,
+            db_job.task_type,
+            db_job.params,
+            db_job.output,
+            db_job.status,
+            db_job.progress,
+            db_job.error_message,
+        )
+
+    job_id, task_type, params, output, status, progress, error_message = db_job
+    return JobRecord.model_construct(
+        job_id=job_id,
+        task_type=task_type,
+        params=params,
+        output=output,
+        status=_STATUS_BY_VALUE.get(status) or JobStatus(status),
+        progress=progress,
+        error_message=error_message,
     )
 
 
 def job_record_to_db_job(
-    job_record: "JobRecord",
+    job_record: JobRecord,
     *,
     created_by: str | None = None,
     priority: int | None = None,
-) -> "Job":
+) -> Job:
     """Create SQLAlchemy Job from Pydantic JobRecord.
 
     Args:
@@ -45,8 +84,6 @@ def job_record_to_db_job(
     Returns:
         SQLAlchemy Job instance (not persisted)
     """
-    import time
-
     return Job(
         job_id=job_record.job_id,
         task_type=job_record.task_type,
@@ -55,7 +92,7 @@ def job_record_to_db_job(
         progress=job_record.progress,
         output=job_record.output,
         error_message=job_record.error_message,
-        created_at=int(time.time() * 1000),
+        created_at=time_ns() // 1_000_000,
         priority=priority or 0,
         retry_count=0,
         max_retries=3,
@@ -0,0 +1,30 @@
+"""JSON encoding helpers shared by the repository and broadcaster paths.
+
+Uses orjson when it is installed (``pip install cl-server-shared[fast]``) and
+falls back to the stdlib json module otherwise. Both backends produce compact
+output and return ``str`` from ``dumps`` so callers never see the difference.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> str:  # pyright: ignore[reportExplicitAny]
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    loads: Callable[[str | bytes], Any] = orjson.loads  # pyright: ignore[reportExplicitAny]
+
+except ImportError:  # pragma: no cover - exercised only without orjson
+    import json
+
+    def dumps(obj: Any) -> str:  # pyright: ignore[reportExplicitAny]
+        """Serialize obj to a JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    loads = json.loads
+
+
+__all__ = ["dumps", "loads"]
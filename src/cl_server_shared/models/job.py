@@ -2,8 +2,7 @@
 
 from typing import TypeAlias, override
 
-from sqlalchemy import BigInteger, Integer, String, Text
-from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy import BigInteger, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.types import JSON
 
@@ -35,23 +34,33 @@ class Job(Base):
     """
 
     __tablename__ = "jobs"  # pyright: ignore[reportUnannotatedClassAttribute]
+    __table_args__ = (  # pyright: ignore[reportUnannotatedClassAttribute]
+        # Serves fetch_next_job: status = 'queued' AND task_type IN (...)
+        # ORDER BY created_at. Partial on PostgreSQL and SQLite, so the index
+        # only holds queued jobs and does not grow with job history; status
+        # stays the leading column so planners without statistics still
+        # prefer it over ix_jobs_status (and dialects without partial
+        # indexes get the full composite index).
+        Index(
+            "ix_jobs_queued_fifo",
+            "status",
+            "task_type",
+            "created_at",
+            postgresql_where=text("status = 'queued'"),
+            sqlite_where=text("status = 'queued'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     job_id: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)
     task_type: Mapped[str] = mapped_column(String, nullable=False)
     priority: Mapped[int] = mapped_column(Integer, nullable=False)
 
-    # JSON fields for params and output (dict, not string)
-    params: Mapped[JSONObject] = mapped_column(
-        MutableDict.as_mutable(JSON),
-        nullable=False,
-        default=dict,
-    )
+    # JSON fields for params and output (dict, not string). In-place changes
+    # are not tracked: assign a new dict to persist a change.
+    params: Mapped[JSONObject] = mapped_column(JSON, nullable=False, default=dict)
 
-    output: Mapped[JSONObject | None] = mapped_column(
-        MutableDict.as_mutable(JSON),
-        nullable=True,
-    )
+    output: Mapped[JSONObject | None] = mapped_column(JSON, nullable=True)
 
     status: Mapped[str] = mapped_column(String, nullable=False, index=True)
     progress: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -0,0 +1,245 @@
+"""Coalescing MQTT publisher for job progress events.
+
+Workers may report progress many times per second; publishing every tick
+synchronously saturates the MQTT client long before the broker does. This
+module buffers progress events per job, publishes only the latest one per
+flush interval, and performs the actual publish on a background thread so
+repository calls never wait on the MQTT socket.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+
+from cl_ml_tools import JobStatus, MQTTBroadcaster, NoOpBroadcaster
+
+from .json_codec import dumps
+
+logger = logging.getLogger(__name__)
+
+# Statuses that end a job; these are never delayed
+_TERMINAL_STATUSES = frozenset({JobStatus.completed, JobStatus.error})
+
+
+class ProgressBroadcaster:
+    """Coalesce per-job progress events and publish them in the background.
+
+    Rules:
+    - Consecutive events with the same job_id and status are buffered and only
+      the latest one is published when the flush interval elapses
+    - A status change publishes the buffered event first, so subscribers still
+      observe every status transition in order
+    - Terminal statuses (completed, error) are queued immediately and are
+      never dropped
+
+    Events ready to publish go onto a bounded FIFO drained by a daemon thread,
+    so callers never wait on the broker. When the FIFO is full (e.g. the
+    broker is unreachable) the oldest non-terminal event is dropped. close()
+    (also run at interpreter exit) publishes everything still buffered and
+    stops the thread.
+
+    Example:
+        progress = ProgressBroadcaster(broadcaster, topic="inference/events")
+        progress.publish("job-1", JobStatus.processing, 10)
+        progress.publish("job-1", JobStatus.processing, 20)  # replaces 10
+        progress.flush()  # publishes progress=20 and waits for delivery
+    """
+
+    __slots__: tuple[str, ...] = (
+        "broadcaster",
+        "topic",
+        "flush_interval",
+        "max_queue_size",
+        "_pending",
+        "_flush_deadline",
+        "_cond",
+        "_outbox",
+        "_delivering",
+        "_worker",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        broadcaster: MQTTBroadcaster | NoOpBroadcaster | None,
+        topic: str,
+        flush_interval_ms: int = 100,
+        max_queue_size: int = 1024,
+    ):
+        """Initialize the progress broadcaster.
+
+        Args:
+            broadcaster: Underlying broadcaster (None disables publishing)
+            topic: MQTT topic for job events
+            flush_interval_ms: Coalescing window in milliseconds (0 disables coalescing)
+            max_queue_size: Maximum number of non-terminal events waiting to be published
+        """
+        self.broadcaster: MQTTBroadcaster | NoOpBroadcaster | None = broadcaster
+        self.topic: str = topic
+        self.flush_interval: float = flush_interval_ms / 1000
+        self.max_queue_size: int = max_queue_size
+
+        # job_id -> (status, progress, timestamp_ms)
+        self._pending: dict[str, tuple[JobStatus, int, int]] = {}
+        self._flush_deadline: float | None = None
+
+        # Guards all state below; the worker waits on it for events or the deadline
+        self._cond: threading.Condition = threading.Condition(threading.Lock())
+
+        # (serialized payload, droppable) in publish order
+        self._outbox: deque[tuple[str, bool]] = deque()
+        self._delivering: bool = False
+        self._worker: threading.Thread | None = None
+        self._closed: bool = False
+
+    def publish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        progress: int,
+        timestamp: int | None = None,
+    ) -> None:
+        """Buffer or queue a progress event; never waits on the broker.
+
+        Args:
+            job_id: Unique job identifier
+            status: Current job status
+            progress: Progress percentage (0-100)
+            timestamp: Event time in milliseconds (defaults to now)
+        """
+        if not self.broadcaster:
+            return
+
+        if timestamp is None:
+            timestamp = time.time_ns() // 1_000_000
+
+        with self._cond:
+            pending = self._pending.get(job_id)
+            if pending is not None and pending[0] is not status:
+                del self._pending[job_id]
+                self._send(job_id, *pending)
+
+            if status in _TERMINAL_STATUSES or self.flush_interval <= 0 or self._closed:
+                _ = self._pending.pop(job_id, None)
+                self._send(job_id, status, progress, timestamp)
+                return
+
+            self._pending[job_id] = (status, progress, timestamp)
+            if self._flush_deadline is None:
+                self._flush_deadline = time.monotonic() + self.flush_interval
+                self._start_worker()
+                self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Publish all buffered events and wait until they are delivered."""
+        with self._cond:
+            self._drain_pending()
+            while self._outbox or self._delivering:
+                _ = self._cond.wait()
+
+    def close(self) -> None:
+        """Publish all buffered events and stop the publisher thread.
+
+        Registered with atexit when the thread starts, so events queued at
+        interpreter exit are not lost. Events published after close() are
+        delivered synchronously.
+        """
+        self.flush()
+        with self._cond:
+            worker, self._worker = self._worker, None
+            self._closed = True
+            self._cond.notify_all()
+
+        if worker is not None:
+            worker.join()
+            atexit.unregister(self.close)
+
+    def _drain_pending(self) -> None:
+        """Move all buffered events onto the outbox (self._cond held)."""
+        self._flush_deadline = None
+        while self._pending:
+            job_id, event = self._pending.popitem()
+            self._send(job_id, *event)
+
+    def _payload(self, job_id: str, status: JobStatus, progress: int, timestamp: int) -> str:
+        """Serialize a single event."""
+        return dumps(
+            {
+                "job_id": job_id,
+                "event_type": status.value,
+                "timestamp": timestamp,
+                "progress": progress,
+            }
+        )
+
+    def _send(self, job_id: str, status: JobStatus, progress: int, timestamp: int) -> None:
+        """Hand one event to the publisher thread (self._cond held).
+
+        When the outbox is full the oldest
+        non-terminal event is dropped; terminal events are always kept. Once
+        closed, events are delivered synchronously instead.
+        """
+        payload = self._payload(job_id, status, progress, timestamp)
+        if self._closed:
+            self._deliver(payload)
+            return
+
+        self._start_worker()
+        if len(self._outbox) >= self.max_queue_size:
+            for index, (_, droppable) in enumerate(self._outbox):
+                if droppable:
+                    del self._outbox[index]
+                    break
+
+        self._outbox.append((payload, status not in _TERMINAL_STATUSES))
+        self._cond.notify_all()
+
+    def _start_worker(self) -> None:
+        """Start the publisher thread unless it is running (self._cond held)."""
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name="progress-broadcaster", daemon=True
+            )
+            self._worker.start()
+            _ = atexit.register(self.close)
+
+    def _deliver(self, payload: str) -> None:
+        """Publish one serialized event, logging (not raising) failures."""
+        try:
+            if self.broadcaster:
+                _ = self.broadcaster.publish_event(topic=self.topic, payload=payload)
+        except Exception:
+            logger.exception("Failed to publish job event")
+
+    def _run(self) -> None:
+        """Worker loop: publish queued events and flush buffered ones when due.
+
+        Exits once closed with an empty outbox. close() sets the flag under
+        the same lock the loop checks it with, and nothing is queued after
+        that, so the exit cannot be missed and every queued event is
+        delivered first.
+        """
+        while True:
+            with self._cond:
+                while True:
+                    deadline = self._flush_deadline
+                    if deadline is not None and time.monotonic() >= deadline:
+                        self._drain_pending()
+                    if self._outbox:
+                        break
+                    if self._closed:
+                        return
+                    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                    _ = self._cond.wait(timeout)
+
+                payload, _ = self._outbox.popleft()
+                self._delivering = True
+
+            try:
+                self._deliver(payload)
+            finally:
+                with self._cond:
+                    self._delivering = False
+                    self._cond.notify_all()
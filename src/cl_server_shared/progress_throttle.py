@@ -0,0 +1,65 @@
+"""Rate limiting for worker progress callbacks.
+
+Task progress callbacks may fire on every percentage point (or more often);
+writing each one through JobRepositoryService.update_job costs a commit and
+an MQTT event. ProgressThrottle decides which values are worth reporting.
+"""
+
+import time
+
+
+class ProgressThrottle:
+    """Decide whether a progress value should be persisted and broadcast.
+
+    A value is reported when it differs from the last reported value and
+    either advanced by at least min_step points or min_interval seconds have
+    passed. 100% (and above) is always reported.
+
+    Example:
+        throttle = ProgressThrottle()
+
+        def progress_callback(percentage: int) -> None:
+            if throttle.should_report(percentage):
+                _ = repository.update_job(job_id, JobRecordUpdate(progress=min(99, percentage)))
+    """
+
+    __slots__: tuple[str, ...] = ("min_step", "min_interval", "_last_progress", "_last_time")
+
+    def __init__(self, min_step: int = 2, min_interval: float = 0.25):
+        """Initialize the throttle.
+
+        Args:
+            min_step: Minimum progress advance (percentage points) to report
+            min_interval: Minimum seconds between reports of smaller advances
+        """
+        self.min_step: int = min_step
+        self.min_interval: float = min_interval
+        self._last_progress: int = -1
+        self._last_time: float = 0.0
+
+    def should_report(self, progress: int) -> bool:
+        """Check whether progress should be reported, recording it if so.
+
+        Args:
+            progress: Current progress percentage
+
+        Returns:
+            True if the caller should persist/broadcast this value
+        """
+        if progress == self._last_progress:
+            return False
+
+        now = time.monotonic()
+        if (
+            progress < 100
+            and progress - self._last_progress < self.min_step
+            and now - self._last_time < self.min_interval
+        ):
+            return False
+
+        self._last_progress = progress
+        self._last_time = now
+        return True
+
+
+__all__ = ["ProgressThrottle"]
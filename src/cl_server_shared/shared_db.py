@@ -8,9 +8,10 @@ The adapters handle:
 - Mapping between library JobRecord (Pydantic) and database Job model (SQLAlchemy)
 - Automatic timestamp management
 - Atomic job claiming with optimistic locking
-- MQTT broadcasting of job progress updates
+- MQTT broadcasting of job progress updates (coalesced per job)
 """
 
+import threading
 import time
 from collections.abc import Sequence
 from typing import override
@@ -26,13 +27,125 @@ from cl_ml_tools import (
     get_broadcaster,
 )
 from pydantic import JsonValue
-from sqlalchemy import select, update
+from sqlalchemy import ColumnElement, bindparam, delete, func, insert, select, update
 from sqlalchemy.orm import Session, sessionmaker
 
 # Application models (SQLAlchemy)
 from .config import Config
-from .job_translator import db_job_to_job_record
+from .job_translator import JOB_RECORD_COLUMNS, db_job_to_job_record
 from .models import Job, QueueEntry
+from .progress_broadcaster import ProgressBroadcaster
+
+# job_id is a unique column but not the primary key, so Session.get() does not
+# apply; build the lookup statements once and bind job_id per call instead.
+# get_job selects only the columns a JobRecord needs, skipping ORM hydration.
+_SELECT_JOB_RECORD = select(*JOB_RECORD_COLUMNS).where(Job.job_id == bindparam("job_id"))
+_DELETE_JOB = delete(Job).where(Job.job_id == bindparam("job_id")).returning(Job.id)
+
+# SET columns vary per call and are added with .values(); the bind name must
+# not collide with the job_id column name in UPDATE statements.
+_UPDATE_JOB = (
+    update(Job)
+    .where(Job.job_id == bindparam("target_job_id"))
+    .returning(Job.job_id)
+    .execution_options(synchronize_session=False)
+)
+
+# JobRecordUpdate fields copied into the UPDATE when not None
+_UPDATE_FIELDS: tuple[str, ...] = tuple(JobRecordUpdate.model_fields)
+
+# Statuses that set completed_at
+_FINISHED_STATUSES = frozenset({JobStatus.completed, JobStatus.error})
+
+# Claim the oldest queued job of the given task types in one statement.
+# On PostgreSQL the subquery locks the row with FOR UPDATE SKIP LOCKED so
+# concurrent workers claim different jobs; status="queued" on the outer
+# UPDATE is the optimistic lock for databases without row locking. Only the
+# JobRecord columns are returned, so no ORM Job is hydrated for the claim.
+_CLAIM_NEXT_JOB = (
+    update(Job)
+    .where(
+        Job.id
+        == (
+            select(Job.id)
+            .where(
+                Job.status == "queued",
+                Job.task_type.in_(bindparam("task_types", expanding=True)),
+            )
+            .order_by(Job.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        ),
+        Job.status == "queued",
+    )
+    .values(status="processing", started_at=bindparam("now_ms"))
+    .returning(*JOB_RECORD_COLUMNS)
+    .execution_options(synchronize_session=False)
+)
+
+
+def _now_ms() -> int:
+    """Current wall-clock time in milliseconds (integer math, no float)."""
+    return time.time_ns() // 1_000_000
+
+
+# (broadcast_type, broker, port) -> broadcaster shared by all repositories
+_broadcasters: dict[tuple[str, str, int], MQTTBroadcaster | NoOpBroadcaster | None] = {}
+_broadcasters_lock = threading.Lock()
+
+
+def _shared_broadcaster(
+    broadcast_type: str, broker: str, port: int
+) -> MQTTBroadcaster | NoOpBroadcaster | None:
+    """Get the broadcaster for a broker, creating it on first use.
+
+    Repository instances in the same process share one MQTT client per
+    (broadcast_type, broker, port) instead of opening a connection each.
+    Creation is serialized so threads constructing repositories at the same
+    time cannot each connect a client and leak all but one.
+    """
+    key = (broadcast_type, broker, port)
+    try:
+        return _broadcasters[key]
+    except KeyError:
+        pass
+
+    with _broadcasters_lock:
+        if key not in _broadcasters:
+            _broadcasters[key] = get_broadcaster(
+                broadcast_type=broadcast_type, broker=broker, port=port
+            )
+        return _broadcasters[key]
+
+
+# (broadcast_type, broker, port, topic, flush_interval_ms) -> progress publisher
+_progress_broadcasters: dict[tuple[str, str, int, str, int], ProgressBroadcaster] = {}
+_progress_lock = threading.Lock()
+
+
+def _shared_progress(
+    broadcast_type: str, broker: str, port: int, topic: str, flush_interval_ms: int
+) -> ProgressBroadcaster:
+    """Get the progress publisher for a broker and topic, creating it on first use.
+
+    Repository instances share one ProgressBroadcaster (and so one publisher
+    thread) per broker and topic, however many repositories a process builds.
+    """
+    key = (broadcast_type, broker, port, topic, flush_interval_ms)
+    try:
+        return _progress_broadcasters[key]
+    except KeyError:
+        pass
+
+    with _progress_lock:
+        if key not in _progress_broadcasters:
+            _progress_broadcasters[key] = ProgressBroadcaster(
+                _shared_broadcaster(broadcast_type, broker, port),
+                topic=topic,
+                flush_interval_ms=flush_interval_ms,
+            )
+        return _progress_broadcasters[key]
 
 
 class JobRepositoryService(JobRepository):
@@ -73,32 +186,41 @@ class JobRepositoryService(JobRepository):
         """
         self.session_factory: sessionmaker[Session] = session_factory
 
-        # Setup broadcaster for job progress updates
-        self.broadcaster: MQTTBroadcaster | NoOpBroadcaster | None = get_broadcaster(
-            broadcast_type=Config.BROADCAST_TYPE,
-            broker=Config.MQTT_BROKER,
-            port=Config.MQTT_PORT,
+        # Setup broadcaster for job progress updates (shared per broker)
+        self.broadcaster: MQTTBroadcaster | NoOpBroadcaster | None = _shared_broadcaster(
+            Config.BROADCAST_TYPE, Config.MQTT_BROKER, Config.MQTT_PORT
+        )
+        self._progress: ProgressBroadcaster = _shared_progress(
+            Config.BROADCAST_TYPE,
+            Config.MQTT_BROKER,
+            Config.MQTT_PORT,
+            Config.MQTT_TOPIC,
+            Config.MQTT_PROGRESS_FLUSH_INTERVAL_MS,
         )
 
-    def _broadcast_progress(self, job_id: str, status: JobStatus, progress: int) -> None:
+    def _broadcast_progress(
+        self, job_id: str, status: JobStatus, progress: int, timestamp: int | None = None
+    ) -> None:
         """Broadcast job progress update via MQTT.
 
+        Intermediate progress events are coalesced by ProgressBroadcaster;
+        status changes and terminal statuses are always published.
+
         Args:
             job_id: Unique job identifier
             status: Current job status
             progress: Progress percentage (0-100)
+            timestamp: Event time in milliseconds (defaults to now)
         """
-        payload = {
-            "job_id": job_id,
-            "event_type": status.value,
-            "timestamp": int(time.time() * 1000),
-            "progress": progress,
-        }
+        self._progress.publish(job_id, status, progress, timestamp)
 
-        if self.broadcaster:
-            import json
+    def flush_broadcasts(self) -> None:
+        """Publish any buffered progress events immediately.
 
-            _ = self.broadcaster.publish_event(topic=Config.MQTT_TOPIC, payload=json.dumps(payload))
+        Call this before shutting down a worker so the latest progress of
+        in-flight jobs is not lost.
+        """
+        self._progress.flush()
 
     @override
     def add_job(
@@ -123,30 +245,57 @@ class JobRepositoryService(JobRepository):
         Returns:
             True if job was saved successfully
         """
-        session: Session
-        with self.session_factory() as session:
-            # Convert Pydantic JobRecord to SQLAlchemy Job
-            db_job = Job(
-                job_id=job.job_id,
-                task_type=job.task_type,
-                params=job.params,  # Pydantic model_dump() converts to dict
-                status=job.status.value,  # Convert enum to string
-                progress=job.progress,
-                created_at=int(time.time() * 1000),  # Current timestamp in milliseconds
-                output=job.output,  # Pydantic model_dump() if present
-                error_message=job.error_message,
-                priority=priority if priority is not None else 0,
-                retry_count=0,
-                max_retries=3,
-                created_by=created_by,
-            )
+        return self.add_jobs([job], created_by=created_by, priority=priority) == 1
+
+    def add_jobs(
+        self,
+        jobs: Sequence[JobRecord],
+        created_by: str | None = None,
+        priority: int | None = None,
+    ) -> int:
+        """Save several jobs to the database in one transaction.
 
-            session.add(db_job)
-            session.commit()
+        Rows are written with a single executemany INSERT and one commit, so
+        enqueueing N jobs costs one round trip instead of N. Either all jobs
+        are saved or none are (e.g. on a duplicate job_id).
 
-            self._broadcast_progress(db_job.job_id, JobStatus(db_job.status), db_job.progress)
+        Args:
+            jobs: Pydantic JobRecords to save
+            created_by: Optional user identifier applied to every job
+            priority: Optional priority level applied to every job
 
-            return True
+        Returns:
+            Number of jobs saved
+        """
+        if not jobs:
+            return 0
+
+        now_ms = _now_ms()
+        rows = [
+            {
+                "job_id": job.job_id,
+                "task_type": job.task_type,
+                "params": job.params,
+                "status": job.status.value,
+                "progress": job.progress,
+                "created_at": now_ms,
+                "output": job.output,
+                "error_message": job.error_message,
+                "priority": priority if priority is not None else 0,
+                "retry_count": 0,
+                "max_retries": 3,
+                "created_by": created_by,
+            }
+            for job in jobs
+        ]
+
+        with self.session_factory.begin() as session:
+            _ = session.execute(insert(Job), rows)
+
+        for job in jobs:
+            self._broadcast_progress(job.job_id, job.status, job.progress, now_ms)
+
+        return len(rows)
 
     @override
     def get_job(self, job_id: str) -> JobRecord | None:
@@ -159,12 +308,11 @@ class JobRepositoryService(JobRepository):
             Pydantic JobRecord if found, None otherwise
         """
         with self.session_factory() as session:
-            stmt = select(Job).where(Job.job_id == job_id)
-            db_job = session.execute(stmt).scalar_one_or_none()
+            row = session.execute(_SELECT_JOB_RECORD, {"job_id": job_id}).one_or_none()
 
-            if db_job:
-                return db_job_to_job_record(db_job)
-            return None
+        if row is not None:
+            return db_job_to_job_record(row)
+        return None
 
     @override
     def update_job(
@@ -186,61 +334,61 @@ class JobRepositoryService(JobRepository):
         Returns:
             True if job was updated, False if job not found
         """
-        with self.session_factory() as session:
-            # Build update values from Pydantic model
-
-            update_values: dict[str, JsonValue] = updates.model_dump(exclude_none=True)
+        now_ms = _now_ms()
+
+        # Build update values from the set (non-None) fields of the Pydantic
+        # model; plain attribute reads are much cheaper than model_dump()
+        update_values: dict[str, JsonValue | ColumnElement[int]] = {
+            name: value
+            for name in _UPDATE_FIELDS
+            if (value := getattr(updates, name)) is not None  # pyright: ignore[reportAny]
+        }
 
-            status = update_values.get("status")
-            if status is not None:
-                job_status = JobStatus(status)
-                update_values["status"] = job_status.value
+        # updates.status is already a validated JobStatus member
+        job_status = updates.status
+        if job_status is not None:
+            update_values["status"] = job_status.value
 
-                now_ms = int(time.time() * 1000)
+            if job_status is JobStatus.processing:
+                # Keep the original started_at if the job was already started
+                update_values["started_at"] = func.coalesce(Job.started_at, now_ms)
 
-                if job_status is JobStatus.processing:
-                    stmt = select(Job.started_at).where(Job.job_id == job_id)
-                    if session.execute(stmt).scalar_one_or_none() is None:
-                        update_values["started_at"] = now_ms
+            elif job_status in _FINISHED_STATUSES:
+                update_values["completed_at"] = now_ms
 
-                elif job_status in (JobStatus.completed, JobStatus.error):
-                    update_values["completed_at"] = now_ms
+        if not update_values:
+            return False
 
-            if not update_values:
-                return False
+        # Execute update; the transaction commits when the block exits
+        with self.session_factory.begin() as session:
+            updated_job_id: str | None = session.execute(
+                _UPDATE_JOB.values(**update_values), {"target_job_id": job_id}
+            ).scalar_one_or_none()
 
-            # Execute update
-            stmt = (
-                update(Job)
-                .where(Job.job_id == job_id)
-                .values(**update_values)
-                .returning(Job.job_id)
-            )
-            updated_job_id: str | None = session.execute(stmt).scalar_one_or_none()
-            session.commit()
+        if updated_job_id is None:
+            return False
 
-            # Broadcast progress update via MQTT if progress was updated
-            if (
-                updated_job_id is not None
-                and updates.status is not None
-                and updates.progress is not None
-            ):
-                self._broadcast_progress(job_id, updates.status, updates.progress)
+        # Broadcast progress update via MQTT if progress was updated
+        if updates.status is not None and updates.progress is not None:
+            self._broadcast_progress(job_id, updates.status, updates.progress, now_ms)
 
-            return updated_job_id is not None
+        return True
 
     @override
     def fetch_next_job(self, task_types: Sequence[str]) -> JobRecord | None:
         """Atomically find and claim the next queued job.
 
-        Uses optimistic locking to prevent race conditions:
-        1. Find job with status="queued" AND task_type in task_types
-        2. Atomically update status to "processing" and set started_at
-        3. Return the claimed job as Pydantic JobRecord
+        Claims the job with a single UPDATE ... RETURNING statement:
+        1. A subquery picks the oldest job with status="queued" AND task_type
+           in task_types (FOR UPDATE SKIP LOCKED on PostgreSQL)
+        2. The UPDATE sets status to "processing" and started_at, guarded by
+           status="queued" (optimistic lock)
+        3. The RETURNING row (JobRecord columns only) is converted to a
+           Pydantic JobRecord, with no refresh SELECT
 
-        The UPDATE ... WHERE query ensures atomicity - only one worker
-        will successfully claim a specific job even if multiple workers
-        query simultaneously.
+        Only one worker can successfully claim a specific job even if multiple
+        workers query simultaneously; on PostgreSQL SKIP LOCKED lets concurrent
+        workers claim different jobs instead of contending for the same row.
 
         Args:
             task_types: Sequence of task types to process
@@ -251,49 +399,21 @@ class JobRepositoryService(JobRepository):
         if not task_types:
             return None
 
-        with self.session_factory() as session:
-            # Find next queued job with matching task type
-            # Order by created_at to process oldest first
-            stmt = (
-                select(Job)
-                .where(
-                    Job.status == "queued",
-                    Job.task_type.in_(task_types),
-                )
-                .order_by(Job.created_at)
-                .limit(1)
-            )
+        now_ms = _now_ms()
 
-            db_job = session.execute(stmt).scalar_one_or_none()
-
-            if not db_job:
-                return None
-
-            # Atomically claim the job using optimistic locking
-            # This UPDATE will only succeed if status is still "queued"
-            current_time = int(time.time() * 1000)
-            stmt = (
-                update(Job)
-                .where(
-                    Job.job_id == db_job.job_id,
-                    Job.status == "queued",  # Optimistic lock
-                )
-                .values(status="processing", started_at=current_time)
-                .returning(Job)
-            )
+        with self.session_factory.begin() as session:
+            row = session.execute(
+                _CLAIM_NEXT_JOB, {"task_types": list(task_types), "now_ms": now_ms}
+            ).one_or_none()
 
-            db_job: Job | None = session.execute(stmt).scalar_one_or_none()
-            session.commit()
+        # No queued job, or another worker claimed it first
+        if row is None:
+            return None
 
-            # Check if we successfully claimed the job
-            if db_job is None:
-                # Another worker claimed it first
-                return None
+        job_record = db_job_to_job_record(row)
 
-            # Refresh the job object to get updated values
-            session.refresh(db_job)
-            self._broadcast_progress(db_job.job_id, JobStatus(db_job.status), db_job.progress)
-            return db_job_to_job_record(db_job)
+        self._broadcast_progress(job_record.job_id, job_record.status, job_record.progress, now_ms)
+        return job_record
 
     @override
     def delete_job(self, job_id: str) -> bool:
@@ -305,16 +425,12 @@ class JobRepositoryService(JobRepository):
         Returns:
             True if job was deleted, False if job not found
         """
-        with self.session_factory() as session:
-            stmt = select(Job).where(Job.job_id == job_id)
-            db_job = session.execute(stmt).scalar_one_or_none()
+        with self.session_factory.begin() as session:
+            deleted_id: int | None = session.execute(
+                _DELETE_JOB, {"job_id": job_id}
+            ).scalar_one_or_none()
 
-            if db_job:
-                session.delete(db_job)
-                session.commit()
-                return True
-
-            return False
+        return deleted_id is not None
 
 
 __all__ = [
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import json
 import os
 import shutil
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 from uuid import uuid4
 
 import pytest
 from cl_ml_tools import JobRecord, JobStatus
-from sqlalchemy import create_engine
+from pydantic import JsonValue
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from cl_server_shared import JobRepositoryService, JobStorageService
 from cl_server_shared.models import Base
@@ -19,7 +22,7 @@ from cl_server_shared.models import Base
 if TYPE_CHECKING:
     from collections.abc import Generator
 
-    from sqlalchemy.engine import Engine
+    from sqlalchemy.engine import Connection, Engine
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -31,30 +34,76 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def in_memory_engine() -> Generator[Engine, None, None]:
     """Create SQLite in-memory engine with all tables created.
 
+    Created once per test session; each test's changes are rolled back by
+    db_connection. StaticPool hands every session the same connection, so
+    all sessions see one in-memory database without file I/O, from any
+    thread.
+
     Yields:
         Engine: SQLAlchemy engine with in-memory SQLite database
     """
-    engine = create_engine("sqlite:///:memory:")
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy
+    # emit BEGIN itself (see "Serializable isolation / Savepoints" in the
+    # SQLAlchemy SQLite dialect docs)
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection: Any, _record: Any) -> None:  # pyright: ignore[reportExplicitAny, reportAny, reportUnusedFunction]
+        dbapi_connection.isolation_level = None  # pyright: ignore[reportAny]
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn: Connection) -> None:  # pyright: ignore[reportUnusedFunction]
+        _ = conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
     yield engine
     engine.dispose()
 
 
 @pytest.fixture
-def session_factory(in_memory_engine: Engine) -> sessionmaker[Session]:
-    """Create session factory bound to in-memory engine.
+def db_connection(in_memory_engine: Engine) -> Generator[Connection, None, None]:
+    """Open a connection whose outer transaction is rolled back after the test.
 
     Args:
         in_memory_engine: SQLAlchemy engine fixture
 
+    Yields:
+        Connection: Connection inside an uncommitted transaction
+    """
+    connection = in_memory_engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def session_factory(db_connection: Connection) -> sessionmaker[Session]:
+    """Create session factory bound to the per-test connection.
+
+    Sessions commit to SAVEPOINTs inside the test's outer transaction, so
+    repository code runs its normal commits while the schema is created
+    only once per test session.
+
+    Args:
+        db_connection: Per-test connection fixture
+
     Returns:
         sessionmaker: Factory for creating database sessions
     """
-    return sessionmaker(bind=in_memory_engine)
+    return sessionmaker(
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
 
 
 @pytest.fixture
@@ -72,11 +121,14 @@ def job_repository(session_factory: sessionmaker[Session]) -> JobRepositoryServi
     return JobRepositoryService(session_factory)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def job_storage(request: pytest.FixtureRequest) -> Generator[JobStorageService, None, None]:
     """Create JobStorageService with test storage directory.
 
-    Priority:
+    Shared by all tests in the session; every test uses its own uuid4 job_id,
+    so jobs never collide and the base directory is created and removed once.
+
+    Base directory priority:
     1. TEST_STORAGE_BASE_DIR environment variable
     2. test_storage_base_dir from pytest config
     3. Default from pytest_addoption
@@ -85,7 +137,7 @@ def job_storage(request: pytest.FixtureRequest) -> Generator[JobStorageService,
         JobStorageService: Storage service instance
 
     Note:
-        Cleans up test artifacts after test completion.
+        Cleans up test artifacts after the test session.
     """
     # Try environment variable first
     base_dir: str | None = os.getenv("TEST_STORAGE_BASE_DIR")
@@ -117,3 +169,25 @@ def sample_job_record() -> JobRecord:
         status=JobStatus.queued,
         progress=0,
     )
+
+
+class RecordingBroadcaster:
+    """Broadcaster stand-in that records published payloads."""
+
+    def __init__(self) -> None:
+        self.events: list[dict[str, JsonValue]] = []
+
+    def publish_event(self, *, topic: str, payload: str) -> bool:
+        _ = topic
+        self.events.append(json.loads(payload))
+        return True
+
+
+@pytest.fixture
+def recording_broadcaster() -> RecordingBroadcaster:
+    """Create a broadcaster that records events instead of publishing them.
+
+    Returns:
+        RecordingBroadcaster: Recorder with an empty events list
+    """
+    return RecordingBroadcaster()
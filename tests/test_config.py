@@ -0,0 +1,151 @@
+"""Tests for Config."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cl_server_shared.config import _SETTINGS, Config, refresh_env  # pyright: ignore[reportPrivateUsage]
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture
+def fresh_config() -> Generator[type[Config], None, None]:
+    """Yield Config with no settings resolved, and reset it afterwards."""
+    refresh_env()
+    yield Config
+    refresh_env()
+
+
+def test_setting_resolved_on_first_access(fresh_config: type[Config]) -> None:
+    """Test that settings are computed lazily and then cached on the class."""
+    assert "MQTT_PORT" not in vars(fresh_config)
+
+    port = fresh_config.MQTT_PORT
+
+    assert isinstance(port, int)
+    assert vars(fresh_config)["MQTT_PORT"] == port
+
+
+def test_setting_reads_environment(
+    fresh_config: type[Config], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that environment variables override defaults."""
+    monkeypatch.setenv("WORKER_ID", "worker-42")
+    monkeypatch.setenv("MQTT_PORT", "1999")
+    monkeypatch.setenv("AUTH_DISABLED", "yes")
+
+    assert fresh_config.WORKER_ID == "worker-42"
+    assert fresh_config.MQTT_PORT == 1999
+    assert fresh_config.AUTH_DISABLED is True
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("true", True), ("1", True), ("Yes", True), ("on", True), ("false", False), ("0", False)],
+)
+def test_bool_setting_parsing(
+    fresh_config: type[Config], monkeypatch: pytest.MonkeyPatch, raw: str, expected: bool
+) -> None:
+    """Test accepted spellings for boolean settings."""
+    monkeypatch.setenv("READ_AUTH_ENABLED", raw)
+
+    assert fresh_config.READ_AUTH_ENABLED is expected
+
+
+def test_list_setting_parsing(fresh_config: type[Config], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that list settings are stripped tuples without empty items."""
+    monkeypatch.setenv("WORKER_SUPPORTED_TASKS", "image_resize, face_detection,")
+
+    assert fresh_config.WORKER_SUPPORTED_TASKS == ("image_resize", "face_detection")
+    assert fresh_config.WORKER_SUPPORTED_TASKS_SET == {"image_resize", "face_detection"}
+
+
+def test_db_pool_settings(fresh_config: type[Config], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test connection pool defaults and overrides."""
+    monkeypatch.setenv("DB_POOL_RECYCLE", "-1")
+
+    assert fresh_config.DB_POOL_USE_LIFO is True
+    assert fresh_config.DB_POOL_PRE_PING is True
+    assert fresh_config.DB_POOL_RECYCLE == -1
+
+
+def test_database_url_defaults_use_cl_server_dir(
+    fresh_config: type[Config], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that per-service database URLs default under CL_SERVER_DIR."""
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+
+    base = fresh_config.CL_SERVER_DIR
+    assert fresh_config.STORE_DATABASE_URL == f"sqlite:///{base}/media_store.db"
+    assert fresh_config.AUTH_DATABASE_URL == f"sqlite:///{base}/user_auth.db"
+
+
+def test_cl_server_dir_checked_on_access_only(
+    fresh_config: type[Config], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a missing CL_SERVER_DIR only fails when it is needed."""
+    monkeypatch.delenv("CL_SERVER_DIR", raising=False)
+
+    assert fresh_config.LOG_LEVEL  # Unrelated settings still resolve
+
+    with pytest.raises(ValueError, match="CL_SERVER_DIR"):
+        _ = fresh_config.CL_SERVER_DIR
+
+
+def test_explicit_database_url_skips_cl_server_dir(
+    fresh_config: type[Config], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that DATABASE_URL is used without requiring CL_SERVER_DIR."""
+    monkeypatch.delenv("CL_SERVER_DIR", raising=False)
+    monkeypatch.setenv("DATABASE_URL", "postgresql://db/jobs")
+
+    assert fresh_config.STORE_DATABASE_URL == "postgresql://db/jobs"
+    assert "CL_SERVER_DIR" not in vars(fresh_config)
+
+
+def test_environment_snapshot_until_refresh(
+    fresh_config: type[Config], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that settings use the snapshot until refresh_env() is called."""
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    assert fresh_config.LOG_LEVEL == "DEBUG"
+
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    monkeypatch.setenv("WORKER_ID", "after-snapshot")
+    assert fresh_config.LOG_LEVEL == "DEBUG"
+    assert fresh_config.WORKER_ID != "after-snapshot"
+
+    refresh_env()
+
+    assert fresh_config.LOG_LEVEL == "WARNING"
+    assert fresh_config.WORKER_ID == "after-snapshot"
+
+
+def test_helpers_read_environment_before_any_setting(
+    fresh_config: type[Config], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that helper methods load the environment snapshot themselves."""
+    monkeypatch.setenv("X_CUSTOM_VALUE", "custom")
+    monkeypatch.setenv("X_CUSTOM_INT", "7")
+    monkeypatch.setenv("X_CUSTOM_BOOL", "on")
+
+    assert fresh_config._get_value("X_CUSTOM_VALUE", "default") == "custom"  # pyright: ignore[reportPrivateUsage]
+    assert fresh_config._get_int("X_CUSTOM_INT", 0) == 7  # pyright: ignore[reportPrivateUsage]
+    assert fresh_config._get_bool("X_CUSTOM_BOOL", False) is True  # pyright: ignore[reportPrivateUsage]
+
+
+def test_every_declared_setting_has_resolver() -> None:
+    """Test that annotated settings without a value are resolvable."""
+    for name in Config.__annotations__:
+        if name not in vars(Config):
+            assert name in _SETTINGS, name
+
+
+def test_unknown_setting_raises() -> None:
+    """Test that unknown attributes still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        _ = Config.NOT_A_SETTING  # pyright: ignore[reportAttributeAccessIssue]
@@ -0,0 +1,70 @@
+"""Tests for database engine helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from cl_server_shared import create_db_engine
+from cl_server_shared.models import Base, Job
+
+
+def test_create_db_engine_sqlite_pragmas(tmp_path: Path) -> None:
+    """Test that SQLite connections are configured for WAL mode."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+    engine.dispose()
+
+
+def test_create_db_engine_json_round_trip(tmp_path: Path) -> None:
+    """Test that JSON columns round-trip through the configured codec."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    params = {"nested": {"key": "value"}, "list": [1, 2, 3], "unicode": "héllo"}
+    with session_factory() as session:
+        session.add(
+            Job(
+                job_id="job1",
+                task_type="test",
+                priority=0,
+                params=params,
+                status="queued",
+                created_at=0,
+            )
+        )
+        session.commit()
+
+    with session_factory() as session:
+        db_job = session.query(Job).filter_by(job_id="job1").one()
+        assert db_job.params == params
+
+    engine.dispose()
+
+
+def test_fetch_next_job_uses_claim_index(tmp_path: Path) -> None:
+    """Test that the claim query is served by the partial queued-jobs index."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(engine)
+
+    with engine.connect() as conn:
+        plan = conn.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM jobs "
+                "WHERE status = :status AND task_type IN ('a', 'b') "
+                "ORDER BY created_at LIMIT 1"
+            ),
+            {"status": "queued"},
+        ).all()
+
+    assert any("ix_jobs_queued_fifo" in str(row) for row in plan)
+
+    engine.dispose()
@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
+import pytest
 from cl_ml_tools import JobRecord, JobRecordUpdate, JobStatus
 from pydantic import JsonValue
-from sqlalchemy import select
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from cl_server_shared import JobRepositoryService
-from cl_server_shared.models import Job
+from cl_server_shared import JobRepositoryService, shared_db
+from cl_server_shared.models import Base, Job
+from cl_server_shared.progress_broadcaster import ProgressBroadcaster
 
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine
-    from sqlalchemy.orm import Session, sessionmaker
+    from sqlalchemy.orm import Session
+
+    from .conftest import RecordingBroadcaster
 
 
 # ============================================================================
@@ -67,6 +75,53 @@ def test_add_job_with_priority(
     assert retrieved is not None
 
 
+def test_add_jobs(job_repository: JobRepositoryService) -> None:
+    """Test adding several jobs in one call."""
+    jobs = [
+        JobRecord(
+            job_id=str(uuid4()),
+            task_type="test_task",
+            params={"index": i},
+            status=JobStatus.queued,
+            progress=0,
+        )
+        for i in range(5)
+    ]
+
+    result = job_repository.add_jobs(jobs, created_by="bulk_user", priority=2)
+
+    assert result == len(jobs)
+    for i, job in enumerate(jobs):
+        retrieved = job_repository.get_job(job.job_id)
+        assert retrieved is not None
+        assert retrieved.params == {"index": i}
+        assert retrieved.status == JobStatus.queued
+
+
+def test_add_jobs_empty(job_repository: JobRepositoryService) -> None:
+    """Test adding an empty batch is a no-op."""
+    assert job_repository.add_jobs([]) == 0
+
+
+def test_add_jobs_is_atomic(
+    job_repository: JobRepositoryService, sample_job_record: JobRecord
+) -> None:
+    """Test a batch with a duplicate job_id saves nothing."""
+    _ = job_repository.add_job(sample_job_record)
+    new_job = JobRecord(
+        job_id=str(uuid4()),
+        task_type="test_task",
+        params={},
+        status=JobStatus.queued,
+        progress=0,
+    )
+
+    with pytest.raises(IntegrityError):
+        _ = job_repository.add_jobs([new_job, sample_job_record])
+
+    assert job_repository.get_job(new_job.job_id) is None
+
+
 def test_get_job(job_repository: JobRepositoryService, sample_job_record: JobRecord) -> None:
     """Test retrieving an existing job."""
     _ = job_repository.add_job(sample_job_record)
@@ -503,6 +558,103 @@ def test_mqtt_broadcast_on_fetch(
     assert fetched is not None
 
 
+def test_add_and_update_events_reach_broadcaster(
+    job_repository: JobRepositoryService,
+    sample_job_record: JobRecord,
+    recording_broadcaster: RecordingBroadcaster,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that add_job and update_job events are published."""
+    progress = ProgressBroadcaster(recording_broadcaster, topic="test/events")  # pyright: ignore[reportArgumentType]
+    monkeypatch.setattr(job_repository, "_progress", progress)
+
+    _ = job_repository.add_job(sample_job_record)
+    _ = job_repository.update_job(
+        sample_job_record.job_id, JobRecordUpdate(status=JobStatus.processing, progress=50)
+    )
+    job_repository.flush_broadcasts()
+
+    assert [
+        (e["job_id"], e["event_type"], e["progress"]) for e in recording_broadcaster.events
+    ] == [
+        (sample_job_record.job_id, "queued", 0),
+        (sample_job_record.job_id, "processing", 50),
+    ]
+
+
+def test_repositories_share_progress_broadcaster(
+    session_factory: sessionmaker[Session],
+) -> None:
+    """Test that repositories share one progress publisher (and thread)."""
+    repositories = [JobRepositoryService(session_factory) for _ in range(3)]
+
+    progress = {id(repo._progress) for repo in repositories}  # pyright: ignore[reportPrivateUsage]
+
+    assert len(progress) == 1
+
+
+def test_shared_broadcaster_created_once_across_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test concurrent repository construction shares a single broadcaster."""
+    created: list[object] = []
+
+    def slow_get_broadcaster(**_: object) -> object:
+        time.sleep(0.01)
+        broadcaster = object()
+        created.append(broadcaster)
+        return broadcaster
+
+    monkeypatch.setattr(shared_db, "_broadcasters", {})
+    monkeypatch.setattr(shared_db, "get_broadcaster", slow_get_broadcaster)
+
+    results: list[object] = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                shared_db._shared_broadcaster("mqtt", "localhost", 1883)  # pyright: ignore[reportPrivateUsage]
+            )
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
+
+
+def test_engine_bound_repository_lifecycle() -> None:
+    """Test all operations when the session factory is bound to an Engine."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    repository = JobRepositoryService(sessionmaker(bind=engine))
+    job = JobRecord(
+        job_id=str(uuid4()),
+        task_type="test",
+        params={},
+        status=JobStatus.queued,
+        progress=0,
+    )
+
+    try:
+        assert repository.add_jobs([job]) == 1
+
+        claimed = repository.fetch_next_job(["test"])
+        assert claimed is not None
+        assert claimed.status == JobStatus.processing
+
+        assert repository.update_job(job.job_id, JobRecordUpdate(progress=50))
+        retrieved = repository.get_job(job.job_id)
+        assert retrieved is not None
+        assert retrieved.progress == 50
+
+        assert repository.delete_job(job.job_id)
+        assert repository.get_job(job.job_id) is None
+    finally:
+        engine.dispose()
+
+
 # ============================================================================
 # Data Integrity Tests
 # ============================================================================
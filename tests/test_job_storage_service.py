@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 from uuid import uuid4
@@ -79,6 +81,20 @@ def test_remove_job_not_exists(job_storage: JobStorageService) -> None:
     assert result is False
 
 
+async def test_save_after_remove_recreates_directories(job_storage: JobStorageService) -> None:
+    """Test remove() invalidates remembered directories for the job."""
+    job_id = str(uuid4())
+    job_storage.create_directory(job_id)
+    _ = await job_storage.save(job_id, "output/sub/first.txt", b"first")
+
+    assert job_storage.remove(job_id) is True
+
+    result: SavedJobFile = await job_storage.save(job_id, "output/sub/second.txt", b"second")
+
+    assert result.size == len(b"second")
+    assert job_storage.resolve_path(job_id, "output/sub/second.txt").read_bytes() == b"second"
+
+
 # ============================================================================
 # File Saving (async) Tests
 # ============================================================================
@@ -153,6 +169,36 @@ async def test_save_from_pathlike(job_storage: JobStorageService, tmp_path: Path
     assert dest_path.read_bytes() == content
 
 
+async def test_save_from_path_short_kernel_copy(
+    job_storage: JobStorageService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a copy_file_range stopping before EOF falls back to a full copy."""
+    job_id = str(uuid4())
+    source_file = tmp_path / "source.bin"
+    content = b"x" * 4096
+    _ = source_file.write_bytes(content)
+
+    monkeypatch.setattr(os, "copy_file_range", lambda *_: 0, raising=False)
+
+    result = await job_storage.save(job_id, "input/short.bin", source_file)
+
+    assert result.size == len(content)
+    assert result.hash == hashlib.sha256(content).hexdigest()
+    assert job_storage.resolve_path(job_id, "input/short.bin").read_bytes() == content
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="requires procfs")
+async def test_save_from_path_reporting_zero_size(job_storage: JobStorageService) -> None:
+    """Test copying a file whose st_size is 0 but which has content (procfs)."""
+    job_id = str(uuid4())
+
+    result = await job_storage.save(job_id, "input/status.txt", "/proc/self/status")
+
+    saved = job_storage.resolve_path(job_id, "input/status.txt").read_bytes()
+    assert result.size == len(saved) > 0
+    assert result.hash == hashlib.sha256(saved).hexdigest()
+
+
 async def test_save_async_file(job_storage: JobStorageService) -> None:
     """Test saving from async file-like object."""
     job_id = str(uuid4())
@@ -210,6 +256,53 @@ async def test_save_with_mkdirs(job_storage: JobStorageService) -> None:
     assert file_path.parent.exists()
 
 
+async def test_save_skips_mkdir_for_known_directories(
+    job_storage: JobStorageService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test saves into directories made by create_directory do not mkdir again."""
+    job_id = str(uuid4())
+    job_storage.create_directory(job_id)
+
+    mkdir_calls: list[Path] = []
+    original_mkdir = Path.mkdir
+
+    def recording_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+        mkdir_calls.append(self)
+        original_mkdir(self, *args, **kwargs)  # pyright: ignore[reportArgumentType]
+
+    monkeypatch.setattr(Path, "mkdir", recording_mkdir)
+
+    _ = await job_storage.save(job_id, "input/a.txt", b"a")
+    _ = job_storage.allocate_path(job_id, "output/b.txt")
+    assert mkdir_calls == []
+
+    _ = await job_storage.save(job_id, "output/sub/c.txt", b"c")
+    _ = await job_storage.save(job_id, "output/sub/d.txt", b"d")
+    assert mkdir_calls == [job_storage.resolve_path(job_id, "output/sub")]
+
+
+async def test_directory_cache_concurrent_saves(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Concurrent saves across many jobs keep the bounded mkdir cache consistent."""
+    storage = JobStorageService(base_dir=str(tmp_path))
+    monkeypatch.setattr(JobStorageService, "_MAX_CACHED_JOBS", 4)
+    job_ids = [str(uuid4()) for _ in range(16)]
+
+    _ = await asyncio.gather(
+        *(
+            storage.save(job_id, f"output/{n}/file.txt", b"x")
+            for job_id in job_ids
+            for n in range(4)
+        )
+    )
+
+    for job_id in job_ids:
+        for n in range(4):
+            assert storage.resolve_path(job_id, f"output/{n}/file.txt").read_bytes() == b"x"
+    assert len(storage._known_dirs) <= 4  # pyright: ignore[reportPrivateUsage]
+
+
 async def test_save_without_mkdirs(job_storage: JobStorageService) -> None:
     """Test saving with mkdirs=False."""
     job_id = str(uuid4())
@@ -462,6 +555,65 @@ async def test_hash_calculation_async(job_storage: JobStorageService) -> None:
     assert result.hash == expected_hash
 
 
+async def test_save_async_stream_spanning_batches(job_storage: JobStorageService) -> None:
+    """Test async stream larger than the write buffer with uneven reads."""
+    job_id = str(uuid4())
+    job_storage.create_directory(job_id)
+
+    # 9.5 MB of non-repeating content, read back in odd-sized pieces
+    content = bytes(range(256)) * (38 * 1024)
+
+    class ShortReadAsyncFile:
+        data: bytes
+        pos: int
+
+        def __init__(self, data: bytes):
+            self.data = data
+            self.pos = 0
+
+        async def read(self, size: int = -1) -> bytes:
+            result = self.data[self.pos : self.pos + min(size, 777_777)]
+            self.pos += len(result)
+            return result
+
+    relative_path = "input/stream.bin"
+
+    result: SavedJobFile = await job_storage.save(
+        job_id, relative_path, ShortReadAsyncFile(content)
+    )
+
+    assert result.size == len(content)
+    assert result.hash == hashlib.sha256(content).hexdigest()
+    assert job_storage.resolve_path(job_id, relative_path).read_bytes() == content
+
+
+async def test_save_async_stream_reuses_write_buffer(job_storage: JobStorageService) -> None:
+    """Test write buffers are returned to the pool and reused."""
+    job_id = str(uuid4())
+    job_storage.create_directory(job_id)
+
+    class AsyncBytesIO:
+        data: bytes
+        pos: int
+
+        def __init__(self, data: bytes):
+            self.data = data
+            self.pos = 0
+
+        async def read(self, size: int = -1) -> bytes:
+            result = self.data[self.pos : self.pos + size]
+            self.pos += len(result)
+            return result
+
+    _ = await job_storage.save(job_id, "input/a.bin", AsyncBytesIO(b"first"))
+    pooled = list(JobStorageService._buffer_pool)  # pyright: ignore[reportPrivateUsage]
+    assert pooled
+
+    _ = await job_storage.save(job_id, "input/b.bin", AsyncBytesIO(b"second"))
+    assert JobStorageService._buffer_pool[-1] is pooled[-1]  # pyright: ignore[reportPrivateUsage]
+    assert job_storage.resolve_path(job_id, "input/b.bin").read_bytes() == b"second"
+
+
 # ============================================================================
 # Path Guarantee Tests
 # ============================================================================
@@ -0,0 +1,215 @@
+"""Tests for ProgressBroadcaster."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+from cl_ml_tools import JobStatus
+
+from cl_server_shared import progress_broadcaster
+from cl_server_shared.progress_broadcaster import ProgressBroadcaster
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .conftest import RecordingBroadcaster
+
+
+def test_progress_coalesces_same_status(recording_broadcaster: RecordingBroadcaster) -> None:
+    """Test that repeated progress for one status publishes only the latest."""
+    progress = ProgressBroadcaster(
+        recording_broadcaster,  # pyright: ignore[reportArgumentType]
+        topic="test/events",
+        flush_interval_ms=10_000,
+    )
+
+    for pct in (10, 20, 30):
+        progress.publish("job1", JobStatus.processing, pct)
+    assert recording_broadcaster.events == []
+
+    progress.flush()
+
+    assert [e["progress"] for e in recording_broadcaster.events] == [30]
+
+
+def test_progress_publishes_status_transitions(
+    recording_broadcaster: RecordingBroadcaster,
+) -> None:
+    """Test that status changes and terminal statuses are not dropped."""
+    progress = ProgressBroadcaster(
+        recording_broadcaster,  # pyright: ignore[reportArgumentType]
+        topic="test/events",
+        flush_interval_ms=10_000,
+    )
+
+    progress.publish("job1", JobStatus.queued, 0)
+    progress.publish("job1", JobStatus.processing, 50)
+    progress.publish("job1", JobStatus.completed, 100)
+    progress.flush()
+
+    assert [(e["event_type"], e["progress"]) for e in recording_broadcaster.events] == [
+        ("queued", 0),
+        ("processing", 50),
+        ("completed", 100),
+    ]
+
+
+def test_progress_publish_does_not_block_on_broker(
+    recording_broadcaster: RecordingBroadcaster,
+) -> None:
+    """Test that publishing happens on the background thread."""
+    progress = ProgressBroadcaster(
+        recording_broadcaster,  # pyright: ignore[reportArgumentType]
+        topic="test/events",
+        flush_interval_ms=0,
+    )
+    caller = threading.get_ident()
+    publisher_threads: list[int] = []
+    original = recording_broadcaster.publish_event
+
+    def publish_event(*, topic: str, payload: str) -> bool:
+        publisher_threads.append(threading.get_ident())
+        return original(topic=topic, payload=payload)
+
+    recording_broadcaster.publish_event = publish_event  # pyright: ignore[reportAttributeAccessIssue]
+
+    progress.publish("job1", JobStatus.processing, 10)
+    progress.flush()
+
+    assert len(recording_broadcaster.events) == 1
+    assert publisher_threads and caller not in publisher_threads
+
+
+def test_progress_flushes_after_interval(recording_broadcaster: RecordingBroadcaster) -> None:
+    """Test that buffered events are published by the flush timer."""
+    progress = ProgressBroadcaster(
+        recording_broadcaster,  # pyright: ignore[reportArgumentType]
+        topic="test/events",
+        flush_interval_ms=10,
+    )
+    published = threading.Event()
+    original = recording_broadcaster.publish_event
+
+    def publish_event(*, topic: str, payload: str) -> bool:
+        result = original(topic=topic, payload=payload)
+        published.set()
+        return result
+
+    recording_broadcaster.publish_event = publish_event  # pyright: ignore[reportAttributeAccessIssue]
+
+    progress.publish("job1", JobStatus.processing, 42)
+
+    # No flush(): only the timer on the publisher thread can deliver it
+    assert published.wait(timeout=5)
+    assert [e["progress"] for e in recording_broadcaster.events] == [42]
+
+
+def _gate_broker(recording_broadcaster: RecordingBroadcaster) -> threading.Event:
+    """Make publish_event block until the returned event is set."""
+    gate = threading.Event()
+    original = recording_broadcaster.publish_event
+
+    def publish_event(*, topic: str, payload: str) -> bool:
+        _ = gate.wait(timeout=5)
+        return original(topic=topic, payload=payload)
+
+    recording_broadcaster.publish_event = publish_event  # pyright: ignore[reportAttributeAccessIssue]
+    return gate
+
+
+def test_terminal_status_does_not_wait_for_broker(
+    recording_broadcaster: RecordingBroadcaster,
+) -> None:
+    """Test that terminal events are queued in order without blocking the caller."""
+    progress = ProgressBroadcaster(
+        recording_broadcaster,  # pyright: ignore[reportArgumentType]
+        topic="test/events",
+        flush_interval_ms=0,
+    )
+    gate = _gate_broker(recording_broadcaster)
+
+    progress.publish("job1", JobStatus.processing, 90)
+    progress.publish("job1", JobStatus.completed, 100)
+
+    # publish() returned while the broker is still stuck on the first event
+    assert recording_broadcaster.events == []
+
+    gate.set()
+    progress.flush()
+
+    assert [e["event_type"] for e in recording_broadcaster.events] == ["processing", "completed"]
+
+
+def test_terminal_status_never_dropped(recording_broadcaster: RecordingBroadcaster) -> None:
+    """Test that a full queue drops progress events but keeps terminal ones."""
+    progress = ProgressBroadcaster(
+        recording_broadcaster,  # pyright: ignore[reportArgumentType]
+        topic="test/events",
+        flush_interval_ms=0,
+        max_queue_size=2,
+    )
+    gate = _gate_broker(recording_broadcaster)
+
+    progress.publish("job1", JobStatus.processing, 10)
+    progress.publish("job1", JobStatus.completed, 100)
+    for pct in range(5):
+        progress.publish("job2", JobStatus.processing, pct)
+
+    gate.set()
+    progress.flush()
+
+    events = [(e["job_id"], e["event_type"], e["progress"]) for e in recording_broadcaster.events]
+    assert ("job1", "completed", 100) in events
+    assert events[-1] == ("job2", "processing", 4)
+    assert len(events) < 7
+
+
+def test_close_while_worker_waiting(recording_broadcaster: RecordingBroadcaster) -> None:
+    """Test that close() stops a publisher thread that is idle waiting for events."""
+    progress = ProgressBroadcaster(
+        recording_broadcaster,  # pyright: ignore[reportArgumentType]
+        topic="test/events",
+        flush_interval_ms=0,
+    )
+    progress.publish("job1", JobStatus.processing, 10)
+    progress.flush()
+    worker = progress._worker  # pyright: ignore[reportPrivateUsage]
+    assert worker is not None
+
+    closer = threading.Thread(target=progress.close, daemon=True)
+    closer.start()
+    closer.join(timeout=5)
+
+    assert not closer.is_alive()
+    assert not worker.is_alive()
+
+
+def test_close_publishes_buffered_events_and_stops_thread(
+    recording_broadcaster: RecordingBroadcaster, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that close() delivers pending events and joins the publisher."""
+    registered: list[Callable[[], None]] = []
+    monkeypatch.setattr(progress_broadcaster.atexit, "register", registered.append)
+    progress = ProgressBroadcaster(
+        recording_broadcaster,  # pyright: ignore[reportArgumentType]
+        topic="test/events",
+        flush_interval_ms=10_000,
+    )
+
+    progress.publish("job1", JobStatus.processing, 40)
+    worker = progress._worker  # pyright: ignore[reportPrivateUsage]
+    assert worker is not None
+    assert registered == [progress.close]
+
+    progress.close()
+
+    assert not worker.is_alive()
+    assert [e["progress"] for e in recording_broadcaster.events] == [40]
+
+    # Still usable after close(), publishing synchronously
+    progress.publish("job1", JobStatus.processing, 60)
+    progress.close()
+    assert [e["progress"] for e in recording_broadcaster.events] == [40, 60]
+    assert progress._worker is None  # pyright: ignore[reportPrivateUsage]
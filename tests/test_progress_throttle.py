@@ -0,0 +1,36 @@
+"""Tests for ProgressThrottle."""
+
+from __future__ import annotations
+
+import time
+
+from cl_server_shared import ProgressThrottle
+
+
+def test_throttle_reports_large_steps() -> None:
+    """Test that advances of at least min_step are reported."""
+    throttle = ProgressThrottle(min_step=5, min_interval=60)
+
+    reported = [pct for pct in range(0, 101) if throttle.should_report(pct)]
+
+    assert reported == list(range(0, 100, 5)) + [100]
+
+
+def test_throttle_reports_after_interval() -> None:
+    """Test that small advances are reported once min_interval has passed."""
+    throttle = ProgressThrottle(min_step=50, min_interval=0.01)
+
+    assert throttle.should_report(1) is True
+    assert throttle.should_report(2) is False
+
+    time.sleep(0.02)
+
+    assert throttle.should_report(3) is True
+
+
+def test_throttle_skips_repeated_value() -> None:
+    """Test that an unchanged value is never reported twice."""
+    throttle = ProgressThrottle(min_step=1, min_interval=0)
+
+    assert throttle.should_report(100) is True
+    assert throttle.should_report(100) is False